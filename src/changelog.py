@@ -1,21 +1,50 @@
 import git
 import os
 import logging
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
-from .models import ChangelogEntry, VersionComparison
+from typing import Dict, List, Optional, Tuple
+from .models import ChangelogEntry, ChangelogProvenance, ChangelogSource, VersionComparison
 import re
 from . import frontmatter
+from .provenance import ProvenanceIndex
 
 logger = logging.getLogger(__name__)
 
+PRIMARY_SOURCE_NAME = "origin"
+
 class ChangelogManager:
-    def __init__(self, repo_path: str = "./shopware_repo"):
+    def __init__(self, repo_path: str = "./shopware_repo", sources: Optional[List[ChangelogSource]] = None,
+                 max_workers: int = 4, source_name: str = PRIMARY_SOURCE_NAME):
+        """
+        The repository at repo_path is the primary source. Additional sources
+        are fetched into its object store and checked out as worktrees next to
+        it, see sync_sources().
+        """
         self.repo_path = repo_path
         self.repo_url = "https://github.com/shopware/shopware.git"
+        self.sources = sources or []
+        self.max_workers = max_workers
+        self.source_name = source_name
+        self._provenance: Optional[Dict[str, ChangelogProvenance]] = None
+        self._source_managers: List["ChangelogManager"] = []
+
+        names = [source.name for source in self.sources]
+        if PRIMARY_SOURCE_NAME in names or len(names) != len(set(names)):
+            raise ValueError(f"Source names must be unique and not '{PRIMARY_SOURCE_NAME}': {names}")
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
 
     def get_available_versions(self) -> List[str]:
-        """Get all available changelog versions from the repository."""
+        """Get all available changelog versions from all synced sources."""
+        versions = set()
+        for manager in self._tree_managers():
+            versions.update(manager._get_tree_versions())
+        return sorted(versions)
+
+    def _get_tree_versions(self) -> List[str]:
+        """Get the changelog versions of this manager's working tree only."""
         changelog_dir = Path(self.repo_path) / "changelog"
         if not changelog_dir.exists():
             return []
@@ -32,36 +61,129 @@ class ChangelogManager:
         if os.path.exists(self.repo_path):
             repo = git.Repo(self.repo_path)
             repo.remotes.origin.pull()
+            self._provenance = None
             return repo
         return git.Repo.clone_from(self.repo_url, self.repo_path)
 
+    def sync_sources(self) -> None:
+        """
+        Update the primary repository and all additional sources.
+
+        Additional sources are remotes of the primary repository, so they share
+        its object store and only download objects it doesn't have yet. After
+        the primary repository is updated, they are fetched concurrently,
+        bounded by max_workers, and each one is
+        checked out as a sparse worktree containing only the changelogs.
+        """
+        # The primary repository provides the object store. Update it before the
+        # source fetches, so its pull doesn't race with their ref and object writes.
+        repo = self.clone_or_pull_repo()
+        for source in self.sources:
+            self._ensure_remote(repo, source)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self._fetch_source, source) for source in self.sources]
+            for future in futures:
+                future.result()
+
+        self._source_managers = [self._checkout_source(repo, source) for source in self.sources]
+
+    def _tree_managers(self) -> List["ChangelogManager"]:
+        """Get the managers of all working trees, the primary one first."""
+        return [self] + self._source_managers
+
+    def _source_path(self, source: ChangelogSource) -> str:
+        return os.path.join(f"{os.path.normpath(self.repo_path)}-sources", source.name)
+
+    def _source_ref(self, source: ChangelogSource) -> str:
+        return f"refs/remotes/{source.name}/{source.branch or 'HEAD'}"
+
+    def _ensure_remote(self, repo: git.Repo, source: ChangelogSource) -> None:
+        """Register the source as a remote, done up front as config writes are not concurrent-safe."""
+        if source.name in [remote.name for remote in repo.remotes]:
+            remote = repo.remote(source.name)
+            if remote.url != source.repo_url:
+                remote.set_url(source.repo_url)
+        else:
+            repo.create_remote(source.name, source.repo_url)
+
+    def _fetch_source(self, source: ChangelogSource) -> None:
+        """Fetch a single source branch, run from the worker pool."""
+        remote_ref = f"refs/heads/{source.branch}" if source.branch else "HEAD"
+        logger.info(f"Fetching {source.name} from {source.repo_url}")
+        # Each worker uses its own Repo, and FETCH_HEAD is shared between all fetches
+        git.Repo(self.repo_path).git.fetch(
+            "--no-write-fetch-head", source.name, f"+{remote_ref}:{self._source_ref(source)}"
+        )
+
+    def _checkout_source(self, repo: git.Repo, source: ChangelogSource) -> "ChangelogManager":
+        """Check out the fetched source as a sparse worktree and return its manager."""
+        path = self._source_path(source)
+        ref = self._source_ref(source)
+        if os.path.exists(path) and not self._is_worktree(repo, path):
+            # Left behind, or the primary repository was cloned again
+            logger.warning(f"{path} is not a worktree of {self.repo_path}, recreating it")
+            shutil.rmtree(path)
+        if not os.path.exists(path):
+            repo.git.worktree("prune")
+            repo.git.worktree("add", "--no-checkout", "--detach", path, ref)
+        worktree = git.Repo(path)
+        # Cone mode would also check out all files in the repository root. Set
+        # on every sync so worktrees created with other patterns are fixed up.
+        worktree.git.sparse_checkout("set", "--no-cone", "/changelog/")
+        worktree.git.checkout("--detach", "--force", ref)
+        return ChangelogManager(path, source_name=source.name)
+
+    def _is_worktree(self, repo: git.Repo, path: str) -> bool:
+        """Check whether path is registered as a worktree of the primary repository."""
+        worktrees = [
+            line[len("worktree "):]
+            for line in repo.git.worktree("list", "--porcelain").split('\n')
+            if line.startswith("worktree ")
+        ]
+        return os.path.realpath(path) in [os.path.realpath(worktree) for worktree in worktrees]
+
     def get_all_changelog_files(self) -> List[str]:
-        """Get all changelog files from all versions."""
-        changelog_base = Path(self.repo_path) / "changelog"
-        if not changelog_base.exists():
-            return []
-        
-        files = []
-        for version_dir in changelog_base.glob("release-*"):
-            for file in version_dir.glob("*.md"):
-                # Store relative path from repo root
-                rel_path = file.relative_to(self.repo_path)
-                files.append(str(rel_path))
-        
+        """Get all changelog files from all versions, each file once across all synced sources."""
+        files = set()
+        for manager in self._tree_managers():
+            changelog_base = Path(manager.repo_path) / "changelog"
+            for version_dir in changelog_base.glob("release-*"):
+                for file in version_dir.glob("*.md"):
+                    # Store relative path from repo root
+                    rel_path = file.relative_to(manager.repo_path)
+                    files.add(str(rel_path))
+
         return sorted(files, reverse=True)
 
+    def get_provenance(self) -> Dict[str, ChangelogProvenance]:
+        """Get the git provenance of all changelog files, built once per manager."""
+        if self._provenance is None:
+            self._provenance = ProvenanceIndex(self.repo_path).build()
+        return self._provenance
+
     def parse_changelog_file(self, file_path: str) -> ChangelogEntry:
-        """Parse a single changelog file and return a ChangelogEntry model."""
-        full_path = Path(self.repo_path) / file_path
-        if not full_path.exists():
+        """Parse a single changelog file and return a ChangelogEntry model.
+
+        A file present in several sources is parsed from the first one and
+        tagged with all of them.
+        """
+        trees = [manager for manager in self._tree_managers() if (Path(manager.repo_path) / file_path).exists()]
+        if not trees:
             raise FileNotFoundError(f"Changelog file not found: {file_path}")
-        
+        full_path = Path(trees[0].repo_path) / file_path
+
         # Parse frontmatter and content
         metadata, content = frontmatter.load(full_path)
 
-        # Get filename components for fallback values
-        filename = Path(file_path).name
-        date_part = filename[:10] if len(filename) >= 10 else None
+        # Prefer the date of the adding commit over the filename as fallback,
+        # filenames may carry invalid dates like 2020-25-10
+        provenance = trees[0].get_provenance().get(Path(file_path).as_posix())
+        if provenance is not None:
+            date_part = provenance.commit_date.date().isoformat()
+        else:
+            filename = Path(file_path).name
+            date_part = filename[:10] if len(filename) >= 10 else None
 
         # Extract version from file path (release-6-4-20-0/file.md -> 6.4.20.0)
         version = file_path.split('/')[1].replace('release-', '').replace('-', '.')
@@ -75,25 +197,23 @@ class ChangelogManager:
             issue=metadata.get('issue'),
             author=metadata.get('author'),
             author_email=metadata.get('author_email'),
-            author_github=metadata.get('author_github')
+            author_github=metadata.get('author_github'),
+            commit=provenance.commit if provenance else None,
+            commit_date=provenance.commit_date if provenance else None,
+            merge_date=provenance.merge_date if provenance else None,
+            sources=[manager.source_name for manager in trees]
         )
 
     def get_changelog_entries(self, version: str) -> List[ChangelogEntry]:
-        """Get changelog entries for a specific version."""
+        """Get changelog entries for a specific version from all synced sources."""
         # Replace dots with dashes in version number
         version = version.replace('.', '-')
-        changelog_dir = Path(self.repo_path) / "changelog" / f"release-{version}"
-        
-        if not changelog_dir.exists():
-            raise FileNotFoundError(f"No changelog directory found for version {version} at {changelog_dir}")
+        changelog_dirs = [Path(manager.repo_path) / "changelog" / f"release-{version}" for manager in self._tree_managers()]
 
-        entries = []
-        for file in changelog_dir.glob("*.md"):
-            rel_path = file.relative_to(self.repo_path)
-            changelog_entry = self.parse_changelog_file(str(rel_path))
-            entries.append(changelog_entry)
+        if not any(changelog_dir.exists() for changelog_dir in changelog_dirs):
+            raise FileNotFoundError(f"No changelog directory found for version {version} at {changelog_dirs[0]}")
 
-        return sorted(entries, key=lambda x: x.date if x.date else '')
+        return self.parse_markdown_files(self.get_markdown_files_for_versions([version]))
 
     def _version_to_tuple(self, version: str) -> tuple:
         """Convert version string to comparable tuple."""
@@ -121,14 +241,16 @@ class ChangelogManager:
         return included_versions
 
     def get_markdown_files_for_versions(self, versions: List[str]) -> List[str]:
-        """Get all markdown files for given versions."""
+        """Get all markdown files for given versions, each file once across all synced sources."""
         markdown_files = []
         for version in versions:
-            version_dir = Path(self.repo_path) / "changelog" / f"release-{version}"
-            if version_dir.exists():
-                files = [str(f.relative_to(self.repo_path)) for f in version_dir.glob("*.md")]
-                markdown_files.extend(files)
-        return markdown_files
+            for manager in self._tree_managers():
+                version_dir = Path(manager.repo_path) / "changelog" / f"release-{version}"
+                if version_dir.exists():
+                    files = [str(f.relative_to(manager.repo_path)) for f in version_dir.glob("*.md")]
+                    markdown_files.extend(files)
+        # Trunk and maintenance branches share release folders
+        return list(dict.fromkeys(markdown_files))
 
     def parse_markdown_files(self, files: List[str]) -> List[ChangelogEntry]:
         """Parse markdown files and return structured data as ChangelogEntry objects."""
@@ -152,7 +274,7 @@ class ChangelogManager:
         )
 
     def get_entries_between_versions(self, from_version: str, to_version: str) -> Tuple[List[ChangelogEntry], List[str]]:
-        """Get all changelog entries between two versions, inclusive.
+        """Get all changelog entries between two versions, inclusive, from all synced sources.
         Returns tuple of (entries, parsed_files)"""
         versions = self.get_versions_between(from_version, to_version)
         markdown_files = self.get_markdown_files_for_versions(versions)
@@ -3,27 +3,44 @@ import git
 import json
 import os
 from pathlib import Path
+from typing import List
 from InquirerPy import inquirer
 from .changelog import ChangelogManager
+from .models import ChangelogSource
 from .printer import print_versions, print_version_comparison, print_changelog_file
 from .release_notifier import ReleaseNotifier
 
 app = typer.Typer(help="Shopware Changelog Parser", add_help_option=True, context_settings={"help_option_names": ["-h", "--help"]})
 
+SOURCE_HELP = "Additional source as name=url or name=url#branch, may be repeated (e.g. lts=https://github.com/shopware/shopware.git#6.5.x)"
+JOBS_HELP = "Number of sources to fetch concurrently"
+
+def create_manager(repo_path: str, source: List[str], jobs: int) -> ChangelogManager:
+    """Create a ChangelogManager for the given sources and sync all of them."""
+    try:
+        manager = ChangelogManager(repo_path, [ChangelogSource.from_spec(spec) for spec in source or []], max_workers=jobs)
+    except ValueError as e:
+        typer.echo(f"Error: {e}")
+        raise typer.Exit(1)
+
+    # Clone or update repositories
+    typer.echo("Fetching repository...")
+    try:
+        manager.sync_sources()
+    except (git.exc.GitCommandError, git.exc.InvalidGitRepositoryError) as e:
+        typer.echo(f"Error accessing repository: {e}")
+        raise typer.Exit(1)
+
+    return manager
+
 @app.command()
 def list_versions(
     repo_path: str = typer.Option("./shopware_repo", help="Path to clone/store the repository"),
+    source: List[str] = typer.Option(None, "--source", help=SOURCE_HELP),
+    jobs: int = typer.Option(4, "--jobs", "-j", min=1, help=JOBS_HELP),
 ):
     """List all available changelog versions."""
-    manager = ChangelogManager(repo_path)
-    
-    # Clone or update repository
-    typer.echo("Fetching repository...")
-    try:
-        manager.clone_or_pull_repo()
-    except git.exc.GitCommandError as e:
-        typer.echo(f"Error accessing repository: {e}")
-        raise typer.Exit(1)
+    manager = create_manager(repo_path, source, jobs)
 
     versions = manager.get_available_versions()
     print_versions(versions)
@@ -36,17 +53,11 @@ def compare_versions(
     output_file: Path = typer.Option("./output/changelog.md", help="Output file path for changelog"),
     stdout: bool = typer.Option(False, "--stdout", help="Print changelog to stdout instead of file"),
     format: str = typer.Option("markdown", help="Output format (markdown, json)"),
+    source: List[str] = typer.Option(None, "--source", help=SOURCE_HELP),
+    jobs: int = typer.Option(4, "--jobs", "-j", min=1, help=JOBS_HELP),
 ):
     """Compare changelog entries between two Shopware versions."""
-    manager = ChangelogManager(repo_path)
-
-    # Clone or update repository
-    typer.echo("Fetching repository...")
-    try:
-        manager.clone_or_pull_repo()
-    except git.exc.GitCommandError as e:
-        typer.echo(f"Error accessing repository: {e}")
-        raise typer.Exit(1)
+    manager = create_manager(repo_path, source, jobs)
 
     # If no to_version specified, use the newest available version
     if to_version is None:
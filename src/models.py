@@ -1,7 +1,28 @@
-from datetime import date
+from datetime import date, datetime
 from typing import Optional
 from pydantic import BaseModel, Field
 
+class ChangelogSource(BaseModel):
+    """A repository branch to read changelogs from."""
+    name: str
+    repo_url: str
+    branch: Optional[str] = None  # None tracks the remote's default branch
+
+    @classmethod
+    def from_spec(cls, spec: str) -> "ChangelogSource":
+        """Parse a source given as name=url or name=url#branch."""
+        name, sep, location = spec.partition('=')
+        if not sep or not name or not location:
+            raise ValueError(f"Invalid source '{spec}', expected name=url[#branch]")
+        repo_url, _, branch = location.partition('#')
+        return cls(name=name, repo_url=repo_url, branch=branch or None)
+
+class ChangelogProvenance(BaseModel):
+    """Git history of a changelog file: the commit that added it."""
+    commit: str
+    commit_date: datetime  # author date of the adding commit
+    merge_date: Optional[datetime] = None  # when the first-parent (merge) commit brought it onto the branch
+
 class ChangelogEntry(BaseModel):
     """Represents a single changelog entry."""
     date: str # when using date it failed with string 2020-25-10
@@ -13,6 +34,10 @@ class ChangelogEntry(BaseModel):
     author: Optional[str] = None
     author_email: Optional[str] = None
     author_github: Optional[str] = None
+    commit: Optional[str] = None
+    commit_date: Optional[datetime] = None
+    merge_date: Optional[datetime] = None
+    sources: list[str] = Field(default_factory=list)  # all sources containing the file, the parsed one first
 
 class VersionComparison(BaseModel):
     """Represents a comparison between two versions."""
@@ -0,0 +1,154 @@
+import git
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Tuple
+from .models import ChangelogProvenance
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILENAME = "changelog-provenance.json"
+CACHE_FORMAT_VERSION = 3
+
+# Marks the start of a commit header in the `git log` output, so that
+# headers can't be confused with `--name-status` entries.
+COMMIT_MARKER = "\x1e"
+
+
+class ProvenanceIndex:
+    """
+    Maps changelog files to the commit that added them and the date they
+    landed on the branch.
+
+    The history of `changelog/` is walked with `git log --name-status`, oldest
+    commit first, instead of running `git log` once per file: once over all
+    commits to find the adding commit, and once with `--first-parent -m` to
+    find the commit on the branch itself (usually a merge) that brought the
+    file in. Renames are followed, so files moved from `_unreleased` into a
+    release folder keep their original commits.
+
+    The result is cached in the git directory together with the commit it was
+    built for; later builds only walk the history added since that commit.
+    """
+
+    def __init__(self, repo_path: str, changelog_dir: str = "changelog"):
+        self.repo_path = repo_path
+        self.changelog_dir = changelog_dir
+
+    def build(self) -> Dict[str, ChangelogProvenance]:
+        """Build the index for the current HEAD, reusing the cache where possible."""
+        try:
+            repo = git.Repo(self.repo_path)
+            head = repo.head.commit.hexsha
+        except (git.exc.InvalidGitRepositoryError, git.exc.NoSuchPathError, ValueError):
+            logger.warning(f"No git history available at {self.repo_path}, skipping provenance")
+            return {}
+
+        cache_file = Path(repo.git_dir) / CACHE_FILENAME
+        cached_head, added, merged = self._load_cache(cache_file)
+
+        if cached_head == head:
+            return self._to_models(added, merged)
+
+        if cached_head is not None and self._is_ancestor(repo, cached_head, head):
+            revision_range = f"{cached_head}..{head}"
+        else:
+            # No cache, or history was rewritten: start over
+            revision_range = head
+            added, merged = {}, {}
+
+        # Both passes track paths separately, as each follows renames on its own
+        self._apply_log(self._read_log(repo, revision_range, "%aI"), added, ('commit', 'commit_date'))
+        self._apply_log(
+            self._read_log(repo, revision_range, "%cI", "--first-parent", "-m"),
+            merged,
+            ('merge_commit', 'merge_date'),
+        )
+        self._save_cache(cache_file, head, added, merged)
+        return self._to_models(added, merged)
+
+    def _read_log(self, repo: git.Repo, revision_range: str, date_format: str, *options: str) -> str:
+        """Walk the history of the changelog directory once, oldest commit first."""
+        return repo.git.log(
+            revision_range,
+            *options,
+            "--reverse",
+            "--topo-order",
+            # NUL separated paths are neither quoted nor escaped
+            "-z",
+            "--name-status",
+            "--find-renames",
+            "--diff-filter=AR",
+            f"--format={COMMIT_MARKER}%H%x09{date_format}",
+            "--",
+            self.changelog_dir,
+        )
+
+    def _apply_log(self, log_output: str, records: Dict[str, dict], keys: Tuple[str, str]) -> None:
+        """Apply `git log -z` output to the records in place, storing the commit header under keys."""
+        commit = None
+        tokens = iter(log_output.split('\0'))
+        for token in tokens:
+            if token.startswith(COMMIT_MARKER):
+                commit = dict(zip(keys, token[len(COMMIT_MARKER):].split('\t')))
+                continue
+
+            # The first status after a commit header follows a newline
+            status = token.lstrip('\n')
+            if commit is None or not status:
+                continue
+
+            if status == 'A':
+                # A file deleted and added again keeps its original commit
+                records.setdefault(next(tokens), dict(commit))
+            elif status.startswith('R'):
+                old_path, new_path = next(tokens), next(tokens)
+                records[new_path] = records.pop(old_path, None) or dict(commit)
+
+    def _is_ancestor(self, repo: git.Repo, ancestor: str, descendant: str) -> bool:
+        try:
+            repo.git.merge_base("--is-ancestor", ancestor, descendant)
+            return True
+        except git.exc.GitCommandError:
+            return False
+
+    def _load_cache(self, cache_file: Path) -> tuple:
+        """Return a tuple of (cached_head, added, merged) or (None, {}, {}) if unusable."""
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None, {}, {}
+        except (json.JSONDecodeError, OSError):
+            logger.warning(f"Invalid provenance cache {cache_file}, rebuilding")
+            return None, {}, {}
+
+        if data.get('version') != CACHE_FORMAT_VERSION or data.get('changelog_dir') != self.changelog_dir:
+            return None, {}, {}
+        return data.get('head'), data.get('added', {}), data.get('merged', {})
+
+    def _save_cache(self, cache_file: Path, head: str, added: Dict[str, dict], merged: Dict[str, dict]) -> None:
+        data = {
+            'version': CACHE_FORMAT_VERSION,
+            'changelog_dir': self.changelog_dir,
+            'head': head,
+            'added': added,
+            'merged': merged,
+        }
+        try:
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+        except OSError as e:
+            logger.warning(f"Could not write provenance cache {cache_file}: {e}")
+
+    def _to_models(self, added: Dict[str, dict], merged: Dict[str, dict]) -> Dict[str, ChangelogProvenance]:
+        models = {}
+        for path, record in added.items():
+            merge_record = merged.get(path)
+            models[path] = ChangelogProvenance(
+                commit=record['commit'],
+                commit_date=datetime.fromisoformat(record['commit_date']),
+                merge_date=datetime.fromisoformat(merge_record['merge_date']) if merge_record else None,
+            )
+        return models
@@ -0,0 +1,61 @@
+import os
+import subprocess
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+
+class FixtureRepo:
+    """A throwaway git repository with helpers to commit changelog files."""
+
+    def __init__(self, path: Path, branch: str = "trunk"):
+        self.path = path
+        path.mkdir(parents=True, exist_ok=True)
+        self.git("init", "-q", "-b", branch)
+        self.git("config", "user.name", "Test")
+        self.git("config", "user.email", "test@example.com")
+
+    def git(self, *args: str, date: Optional[str] = None) -> str:
+        env = dict(os.environ)
+        if date:
+            env.update(GIT_AUTHOR_DATE=date, GIT_COMMITTER_DATE=date)
+        result = subprocess.run(["git", *args], cwd=self.path, env=env, check=True, capture_output=True, text=True)
+        return result.stdout.strip()
+
+    def write(self, rel_path: str, title: str, body: str = "Some change") -> None:
+        file = self.path / rel_path
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(f"---\ntitle: {title}\n---\n{body}\n", encoding="utf-8")
+
+    def move(self, old_path: str, new_path: str) -> None:
+        (self.path / new_path).parent.mkdir(parents=True, exist_ok=True)
+        self.git("mv", old_path, new_path)
+
+    def commit(self, message: str, date: Optional[str] = None) -> str:
+        self.git("add", "-A")
+        self.git("commit", "-q", "-m", message, date=date)
+        return self.head()
+
+    def head(self) -> str:
+        return self.git("rev-parse", "HEAD")
+
+    def publish(self, *branches: str) -> str:
+        """Push branches to a bare repository next to this one and return its path."""
+        bare = self.path.with_suffix(".git")
+        if not bare.exists():
+            subprocess.run(["git", "init", "-q", "--bare", str(bare)], check=True, capture_output=True)
+            # Clones check out trunk by default
+            subprocess.run(["git", "-C", str(bare), "symbolic-ref", "HEAD", "refs/heads/trunk"],
+                           check=True, capture_output=True)
+        if branches:
+            self.git("push", "-q", "--force", str(bare), *branches)
+        return str(bare)
+
+
+@pytest.fixture
+def make_repo(tmp_path: Path):
+    """Create fixture repositories below tmp_path."""
+    def factory(name: str = "upstream", branch: str = "trunk") -> FixtureRepo:
+        return FixtureRepo(tmp_path / name, branch)
+    return factory
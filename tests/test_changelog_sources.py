@@ -0,0 +1,132 @@
+import os
+
+import pytest
+
+from src.changelog import ChangelogManager
+from src.models import ChangelogSource
+
+SHARED = "changelog/release-6-5-0-0/2023-01-01-shared.md"
+LTS_ONLY = "changelog/release-6-5-1-0/2023-02-01-lts.md"
+TRUNK_ONLY = "changelog/release-6-6-0-0/2023-03-01-trunk.md"
+FORK_ONLY = "changelog/release-6-6-0-0/2023-04-01-fork.md"
+
+
+@pytest.fixture
+def upstream(make_repo):
+    """A repository with a trunk and a 6.5.x branch sharing the 6.5.0.0 release."""
+    repo = make_repo("upstream")
+    # Root files must not end up in the sparse source worktrees
+    (repo.path / "composer.json").write_text("{}\n", encoding="utf-8")
+    repo.write(SHARED, "Shared")
+    repo.commit("Release 6.5.0.0")
+    repo.git("branch", "6.5.x")
+    repo.write(TRUNK_ONLY, "Trunk")
+    repo.commit("Trunk change")
+    repo.git("checkout", "-q", "6.5.x")
+    repo.write(LTS_ONLY, "LTS")
+    repo.commit("LTS fix")
+    repo.git("checkout", "-q", "trunk")
+    repo.publish("trunk", "6.5.x")
+    return repo
+
+
+def create_manager(upstream, tmp_path, sources, max_workers=2) -> ChangelogManager:
+    manager = ChangelogManager(str(tmp_path / "shopware_repo"), sources, max_workers=max_workers)
+    manager.repo_url = upstream.publish()
+    return manager
+
+
+def test_sync_fetches_branches_into_sparse_worktrees(upstream, tmp_path):
+    manager = create_manager(upstream, tmp_path, [ChangelogSource.from_spec(f"lts={upstream.publish()}#6.5.x")])
+    manager.sync_sources()
+
+    assert manager.get_available_versions() == ["6-5-0-0", "6-5-1-0", "6-6-0-0"]
+    lts_path = tmp_path / "shopware_repo-sources" / "lts"
+    assert sorted(os.listdir(lts_path)) == [".git", "changelog"]
+    assert (lts_path / LTS_ONLY).exists()
+    # The source shares the object store of the primary repository
+    assert (lts_path / ".git").is_file()
+
+
+def test_second_sync_updates_sources(upstream, tmp_path):
+    sources = [ChangelogSource.from_spec(f"lts={upstream.publish()}#6.5.x")]
+    create_manager(upstream, tmp_path, sources).sync_sources()
+
+    lts_update = "changelog/release-6-5-2-0/2023-05-01-lts.md"
+    upstream.git("checkout", "-q", "6.5.x")
+    upstream.write(lts_update, "LTS update")
+    upstream.commit("LTS update")
+    upstream.git("checkout", "-q", "trunk")
+    trunk_update = "changelog/release-6-6-1-0/2023-05-01-trunk.md"
+    upstream.write(trunk_update, "Trunk update")
+    upstream.commit("Trunk update")
+    upstream.publish("trunk", "6.5.x")
+
+    manager = create_manager(upstream, tmp_path, sources)
+    manager.sync_sources()
+
+    assert "6-5-2-0" in manager.get_available_versions()
+    assert "6-6-1-0" in manager.get_available_versions()
+    assert manager.parse_changelog_file(lts_update).sources == ["lts"]
+    assert manager.parse_changelog_file(trunk_update).sources == ["origin"]
+
+
+def test_entries_are_tagged_and_deduplicated(upstream, make_repo, tmp_path):
+    fork = make_repo("fork")
+    fork.git("pull", "-q", upstream.publish(), "trunk")
+    fork.write(FORK_ONLY, "Fork")
+    fork.commit("Fork change")
+    sources = [
+        ChangelogSource.from_spec(f"lts={upstream.publish()}#6.5.x"),
+        ChangelogSource.from_spec(f"fork={fork.publish('trunk')}"),
+    ]
+    manager = create_manager(upstream, tmp_path, sources)
+    manager.sync_sources()
+
+    entries, parsed_files = manager.get_entries_between_versions("6.4.0.0", "6.6.0.0")
+
+    assert sorted(parsed_files) == sorted([SHARED, LTS_ONLY, TRUNK_ONLY, FORK_ONLY])
+    assert {entry.file: entry.sources for entry in entries} == {
+        SHARED: ["origin", "lts", "fork"],
+        LTS_ONLY: ["lts"],
+        TRUNK_ONLY: ["origin", "fork"],
+        FORK_ONLY: ["fork"],
+    }
+    assert [entry.file for entry in manager.get_changelog_entries("6.5.0.0")] == [SHARED]
+    assert manager.get_all_changelog_files() == sorted([SHARED, LTS_ONLY, TRUNK_ONLY, FORK_ONLY], reverse=True)
+
+
+def test_stale_source_directory_is_recreated(upstream, tmp_path):
+    lts_path = tmp_path / "shopware_repo-sources" / "lts"
+    lts_path.mkdir(parents=True)
+    (lts_path / "leftover.txt").write_text("stale")
+
+    manager = create_manager(upstream, tmp_path, [ChangelogSource.from_spec(f"lts={upstream.publish()}#6.5.x")])
+    manager.sync_sources()
+
+    assert sorted(os.listdir(lts_path)) == [".git", "changelog"]
+    assert manager.parse_changelog_file(LTS_ONLY).sources == ["lts"]
+
+
+def test_source_spec_parsing():
+    source = ChangelogSource.from_spec("lts=https://github.com/shopware/shopware.git#6.5.x")
+    assert (source.name, source.repo_url, source.branch) == ("lts", "https://github.com/shopware/shopware.git", "6.5.x")
+    assert ChangelogSource.from_spec("fork=git@github.com:example/shopware.git").branch is None
+
+
+@pytest.mark.parametrize("spec", ["lts", "=https://example.com/repo.git", "lts="])
+def test_invalid_source_spec_is_rejected(spec):
+    with pytest.raises(ValueError):
+        ChangelogSource.from_spec(spec)
+
+
+@pytest.mark.parametrize("names", [["origin"], ["lts", "lts"]])
+def test_reserved_and_duplicate_source_names_are_rejected(names):
+    sources = [ChangelogSource(name=name, repo_url="https://example.com/repo.git") for name in names]
+    with pytest.raises(ValueError):
+        ChangelogManager(sources=sources)
+
+
+def test_non_positive_max_workers_is_rejected():
+    with pytest.raises(ValueError):
+        ChangelogManager(max_workers=0)
@@ -0,0 +1,127 @@
+import json
+import shutil
+from datetime import datetime
+
+from src.changelog import ChangelogManager
+from src.provenance import CACHE_FILENAME, ProvenanceIndex
+
+UNRELEASED = "changelog/_unreleased/2020-25-10-feature.md"
+RELEASED = "changelog/release-6-5-0-0/2020-25-10-feature.md"
+
+
+def utc(day: str) -> datetime:
+    return datetime.fromisoformat(f"{day}T12:00:00+00:00")
+
+
+def test_follows_rename_into_release_folder(make_repo):
+    repo = make_repo()
+    repo.write(UNRELEASED, "Feature")
+    added = repo.commit("Add feature", date="2021-01-02T12:00:00+00:00")
+    repo.move(UNRELEASED, RELEASED)
+    repo.commit("Release 6.5.0.0", date="2021-03-01T12:00:00+00:00")
+
+    provenance = ProvenanceIndex(str(repo.path)).build()
+
+    assert list(provenance) == [RELEASED]
+    assert provenance[RELEASED].commit == added
+    assert provenance[RELEASED].commit_date == utc("2021-01-02")
+    assert provenance[RELEASED].merge_date == utc("2021-01-02")
+
+
+def test_non_ascii_paths_are_not_quoted(make_repo):
+    unreleased = "changelog/_unreleased/2020-01-01-größe.md"
+    released = "changelog/release-6-5-0-0/2020-01-01-größe.md"
+    repo = make_repo()
+    repo.write(unreleased, "Größe")
+    added = repo.commit("Add feature", date="2021-01-02T12:00:00+00:00")
+    repo.move(unreleased, released)
+    repo.commit("Release 6.5.0.0", date="2021-03-01T12:00:00+00:00")
+
+    entry = ChangelogManager(str(repo.path)).parse_changelog_file(released)
+
+    assert entry.commit == added
+    assert entry.date == "2021-01-02"
+    assert entry.merge_date == utc("2021-01-02")
+
+
+def test_merge_date_is_taken_from_first_parent_merge(make_repo):
+    repo = make_repo()
+    repo.write("changelog/release-6-5-0-0/2020-01-01-base.md", "Base")
+    repo.commit("Base", date="2023-12-01T12:00:00+00:00")
+    repo.git("checkout", "-q", "-b", "feature")
+    repo.write(RELEASED, "Feature")
+    added = repo.commit("Add feature", date="2024-01-01T12:00:00+00:00")
+    repo.git("checkout", "-q", "trunk")
+    repo.git("merge", "-q", "--no-ff", "-m", "Merge branch 'feature' into 'trunk'", "feature",
+             date="2024-06-01T12:00:00+00:00")
+
+    provenance = ProvenanceIndex(str(repo.path)).build()
+
+    assert provenance[RELEASED].commit == added
+    assert provenance[RELEASED].commit_date == utc("2024-01-01")
+    assert provenance[RELEASED].merge_date == utc("2024-06-01")
+
+
+def test_readded_file_keeps_original_commit(make_repo):
+    repo = make_repo()
+    repo.write(RELEASED, "Feature")
+    added = repo.commit("Add feature", date="2021-01-02T12:00:00+00:00")
+    repo.git("rm", "-q", RELEASED)
+    repo.commit("Remove feature", date="2021-02-01T12:00:00+00:00")
+    repo.write(RELEASED, "Feature again")
+    repo.commit("Re-add feature", date="2021-03-01T12:00:00+00:00")
+
+    provenance = ProvenanceIndex(str(repo.path)).build()
+
+    assert provenance[RELEASED].commit == added
+    assert provenance[RELEASED].merge_date == utc("2021-01-02")
+
+
+def test_incremental_build_matches_full_rebuild(make_repo):
+    repo = make_repo()
+    repo.write(UNRELEASED, "Feature")
+    repo.commit("Add feature", date="2021-01-02T12:00:00+00:00")
+    index = ProvenanceIndex(str(repo.path))
+    index.build()
+
+    repo.move(UNRELEASED, RELEASED)
+    repo.write("changelog/release-6-5-0-0/2021-02-01-fix.md", "Fix")
+    repo.commit("Release 6.5.0.0", date="2021-03-01T12:00:00+00:00")
+    incremental = index.build()
+
+    cache_file = repo.path / ".git" / CACHE_FILENAME
+    assert json.loads(cache_file.read_text())["head"] == repo.head()
+    cache_file.unlink()
+    assert index.build() == incremental
+
+
+def test_rewritten_history_resets_cache(make_repo):
+    repo = make_repo()
+    repo.write(RELEASED, "Feature")
+    repo.commit("Add feature", date="2021-01-02T12:00:00+00:00")
+    index = ProvenanceIndex(str(repo.path))
+    index.build()
+
+    repo.write("changelog/release-6-5-0-0/2021-02-01-fix.md", "Fix")
+    amended_date = "2021-04-01T12:00:00+00:00"
+    repo.git("add", "-A")
+    repo.git("commit", "-q", "--amend", "--reset-author", "-m", "Add feature and fix", date=amended_date)
+
+    provenance = index.build()
+
+    assert {entry.commit for entry in provenance.values()} == {repo.head()}
+    assert provenance[RELEASED].commit_date == utc("2021-04-01")
+
+
+def test_without_git_history_falls_back_to_filename_date(make_repo):
+    repo = make_repo()
+    repo.write(RELEASED, "Feature")
+    shutil.rmtree(repo.path / ".git")
+
+    manager = ChangelogManager(str(repo.path))
+    entry = manager.parse_changelog_file(RELEASED)
+
+    assert manager.get_provenance() == {}
+    assert entry.date == "2020-25-10"
+    assert entry.commit is None
+    assert entry.merge_date is None